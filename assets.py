@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+import pygame
+
+
+@lru_cache(maxsize=32)
+def load_image(path):
+    '''
+    Загружает изображение с прозрачностью и кэширует его.
+    Все спрайты с одинаковым изображением используют одну поверхность,
+    размер кэша ограничен, поэтому длинные сессии не накапливают поверхности.
+    Без открытого окна (headless-прогоны) изображение возвращается без конвертации.
+    :param path: Путь к файлу изображения.
+    :return: Поверхность с изображением.
+    '''
+    image = pygame.image.load(path)
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert_alpha()
+
+
+def clear_image_cache():
+    '''Очищает кэш изображений (например, после пересоздания окна).'''
+    load_image.cache_clear()
@@ -0,0 +1,35 @@
+import pygame
+
+
+def init_mixer():
+    '''
+    Инициализирует звуковую подсистему при первом обращении к ней.
+    :return: True, если звук доступен.
+    '''
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            return False
+    return True
+
+
+def play_music(path):
+    '''
+    Проигрывает звуковой файл через pygame.mixer.music в цикле.
+    Если звуковое устройство недоступно, вызов ничего не делает.
+    :param path: Путь к звуковому файлу.
+    '''
+    if init_mixer():
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.play(-1)  # Цикл музыки
+
+
+def load_sound(path):
+    '''
+    Загружает звук, инициализируя звуковую подсистему при необходимости.
+    :return: Объект Sound или None, если звук недоступен.
+    '''
+    if init_mixer():
+        return pygame.mixer.Sound(path)
+    return None
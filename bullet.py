@@ -1,6 +1,6 @@
 import pygame
 from pygame.math import Vector2
-from settings import Settings
+from assets import load_image
 
 class Bullet(pygame.sprite.Sprite):
     """
@@ -14,37 +14,62 @@ class Bullet(pygame.sprite.Sprite):
           speed (float): Скорость движения пули.
           damage (int): Урон, который наносит пуля.
           velocity (Vector2): Вектор скорости пули, вычисленный на основе направления к цели.
+          target_id (int): Идентификатор врага, за которым следует самонаводящаяся пуля (None - без наведения).
         """
-    def __init__(self, start_pos, target_pos, damage, game):
+    def __init__(self, start_pos, target_pos, damage, game, target_id=None):
         super().__init__()
         self.game = game
-        self.image = pygame.image.load('assets/bullets/basic_bullet.png').convert_alpha()
+        self.image = load_image('assets/bullets/basic_bullet.png')
         self.rect = self.image.get_rect(center=start_pos)
         self.position = Vector2(start_pos)
         self.target = Vector2(target_pos)
-        self.speed = 5
+        self.speed = game.settings.bullet_speed
         self.damage = damage
+        self.target_id = target_id
         self.velocity = self.calculate_velocity()
-        self.settings = Settings()
+        self.settings = game.settings
     def calculate_velocity(self):
         '''
         Вычисляет вектор скорости пули на основе направления к цели.
         '''
-        direction = (self.target - self.position).normalize()
-        velocity = direction * self.speed
+        direction = self.target - self.position
+        if direction.length() == 0:
+            return Vector2()
+        velocity = direction.normalize() * self.speed
         return velocity
 
+    def track_target(self):
+        '''
+        Перенаправляет самонаводящуюся пулю на текущую позицию цели.
+        Возвращает врага-цель или None, если цель уже погибла.
+        '''
+        enemy = self.game.level.enemy_handles.get(self.target_id)
+        if enemy is not None:
+            self.target = Vector2(enemy.position)
+            self.velocity = self.calculate_velocity()
+        return enemy
+
     def update(self):
         '''
         Обновляет положение пули и проверяет, достигла ли она цели или вышла за пределы экрана.
         '''
+        if self.target_id is not None:
+            # Самонаводящаяся пуля исчезает вместе с целью и наносит урон при подлёте
+            enemy = self.track_target()
+            if enemy is None:
+                self.kill()
+                return
+            if self.position.distance_to(self.target) <= self.speed:
+                enemy.take_damage(self.damage)
+                self.kill()
+                return
         self.position += self.velocity
         self.rect.center = self.position
-        if self.position.distance_to(self.target) < 10 or not self.game.is_position_inside(self.position):
+        reached_target = self.target_id is None and self.position.distance_to(self.target) < 10
+        if reached_target or not self.game.is_position_inside(self.position):
             self.kill()
         # Воспроизведение звука выстрела
-        pygame.mixer.music.load(self.settings.shoot_sound)
-        pygame.mixer.music.play(-1)  # Цикл музыки
+        self.game.play_music(self.settings.shoot_sound)
     def is_position_inside(self, pos):
         '''
         Проверяет, находится ли заданная позиция внутри границ экрана игры
@@ -1,5 +1,6 @@
 import pygame
 from pygame.math import Vector2
+from assets import load_image
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -14,12 +15,13 @@ class Enemy(pygame.sprite.Sprite):
         speed (float): Скорость движения врага.
         health (int): Здоровье врага.
         position (Vector2): Вектор, представляющий текущее положение врага.
+        enemy_id (int): Стабильный идентификатор врага в хранилище уровня.
+        handles (dict): Хранилище врагов уровня (id -> враг), из которого враг удаляется при смерти.
     '''
     def __init__(self, path, speed=2, health=10, image_path=None, game = None):
 
         super().__init__()
-        self.image = pygame.Surface((30, 40))
-        self.image = pygame.image.load(image_path).convert_alpha()
+        self.image = load_image(image_path)
         self.rect = self.image.get_rect()
         self.game = game
         self.path = self.game.settings.enemy_path
@@ -27,6 +29,8 @@ class Enemy(pygame.sprite.Sprite):
         self.speed = speed
         self.health = health
         self.position = pygame.math.Vector2(self.path[self.path_index])
+        self.enemy_id = None
+        self.handles = None
         #self.rect.center = self.position
 
     def take_damage(self, amount):
@@ -35,6 +39,28 @@ class Enemy(pygame.sprite.Sprite):
         if self.health <= 0:
             self.kill()
 
+    def kill(self):
+        '''Убирает врага из всех групп и делает его идентификатор недействительным.'''
+        super().kill()
+        if self.handles is not None:
+            self.handles.pop(self.enemy_id, None)
+
+    def predict_position(self, frames):
+        '''Возвращает позицию, в которой враг окажется через заданное число кадров.'''
+        position = pygame.math.Vector2(self.position)
+        index = self.path_index
+        remaining = self.speed * frames
+        while remaining > 0 and index < len(self.path) - 1:
+            target_pos = pygame.math.Vector2(self.path[index + 1])
+            distance = position.distance_to(target_pos)
+            if distance > remaining:
+                position += (target_pos - position).normalize() * remaining
+                break
+            position = target_pos
+            remaining -= distance
+            index += 1
+        return position
+
     def update(self):
         '''Обновляет позицию врага, двигая его по пути'''
         if self.path_index < len(self.path) - 1:
@@ -53,4 +79,5 @@ class Enemy(pygame.sprite.Sprite):
 
         else:
             # Враг достиг конца пути, можно убрать его из игры
+            self.game.level.record_escape(self)
             self.kill()
\ No newline at end of file
@@ -7,14 +7,12 @@ class Grid:
     Атрибуты:
         game (Game): Ссылка на объект игры, который содержит настройки и экран.
         settings (Settings): Настройки игры, включая позиции башен и размер ячейки.
-        screen (Surface): Экран Pygame, на котором будет рисоваться сетка.
         available_spots (list): Список доступных координат для размещения башен.
         towers (list): Список размещенных башен.
     '''
     def __init__(self, game):
         self.game = game
         self.settings = game.settings
-        self.screen = game.screen
         self.available_spots = self.settings.tower_positions
         self.towers = []
 
@@ -28,9 +26,9 @@ class Grid:
         :param screen: Экран, на котором будет нарисована сетка.
         '''
         for pos in self.game.settings.tower_positions:
-            pygame.draw.circle(self.screen, (128, 0, 0), pos, 10)
+            pygame.draw.circle(screen, (128, 0, 0), pos, 10)
         for spot in self.available_spots:
-            pygame.draw.circle(self.screen, (255, 255, 255), spot, 15, 2)
+            pygame.draw.circle(screen, (255, 255, 255), spot, 15, 2)
 
     def place_tower(self, tower=None):
         '''
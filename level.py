@@ -1,7 +1,7 @@
 import pygame
 from enemy import Enemy
 from tower import BasicTower, SniperTower, MoneyTower
-from settings import Settings
+from wave_generator import WaveGenerator
 
 class Level:
     '''
@@ -13,13 +13,18 @@ class Level:
         enemies (Group): Группа врагов в уровне.
         towers (Group): Группа башен на уровне.
         bullets (Group): Группа снарядов, выстреливаемых башнями.
+        enemy_handles (dict): Хранилище живых врагов по идентификатору для самонаводящихся пуль.
+        next_enemy_id (int): Идентификатор, который получит следующий появившийся враг.
         waves (list): Списки волн врагов, каждая волна содержит информацию о врагах.
         current_wave (int): Индекс текущей волны.
+        wave_number (int): Номер текущей волны с начала игры (в бесконечном режиме растёт без ограничения).
+        wave_generator (WaveGenerator): Генератор волн бесконечного режима (None в обычном режиме).
         spawned_enemies (int): Количество врагов, уже появившихся на уровне.
         spawn_delay (int): Задержка между спавном врагов в миллисекундах.
         last_spawn_time (int): Время последнего спавна врага.
         all_waves_complete (bool): Флаг, указывающий, завершены ли все волны врагов.
-        font (Font): Шрифт для отрисовки текста.
+        escaped_enemies (int): Количество врагов, дошедших до конца пути.
+        escaped_health (int): Суммарное оставшееся здоровье врагов, дошедших до конца пути.
     '''
     def __init__(self, game):
         self.game = game
@@ -28,19 +33,28 @@ class Level:
         self.enemies = pygame.sprite.Group()
         self.towers = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
+        self.enemy_handles = {}
+        self.next_enemy_id = 0
         self.waves = [
             [{'path': self.game.settings.enemy_path, 'speed': 1, 'health': 100, 'image_path': 'assets/enemies/basic_enemy.png'}] * 5,
             [{'path': self.game.settings.enemy_path, 'speed': 1.5, 'health': 150, 'image_path': 'assets/enemies/fast_enemy.png'}] * 7,
             [{'path': self.game.settings.enemy_path, 'speed': 0.75, 'health': 200, 'image_path': 'assets/enemies/strong_enemy.png'}] * 4,
         ]
+        self.wave_generator = None
+        if self.game.settings.endless_mode:
+            # В бесконечном режиме хранится только текущая волна, следующая генерируется по номеру
+            self.wave_generator = WaveGenerator(self.game.settings.enemy_path, self.game.settings.endless_seed)
+            self.waves = [self.wave_generator.generate(0)]
         self.current_wave = 0
+        self.wave_number = 0
         self.spawned_enemies = 0
         self.spawn_delay = 1000
         self.last_spawn_time = pygame.time.get_ticks()
         self.all_waves_complete = False
+        self.escaped_enemies = 0
+        self.escaped_health = 0
         self.start_next_wave()
-        self.font = pygame.font.SysFont("Arial", 24)
-        self.settings = Settings()
+        self.settings = self.game.settings
     def start_next_wave(self):
         '''Запускает следующую волну врагов.'''
         if self.current_wave < len(self.waves):
@@ -52,16 +66,29 @@ class Level:
         if self.spawned_enemies < len(self.waves[self.current_wave]):
             enemy_info = self.waves[self.current_wave][self.spawned_enemies]
             new_enemy = Enemy(**enemy_info, game=self.game)
-            self.enemies.add(new_enemy)
+            self.add_enemy(new_enemy)
             self.spawned_enemies += 1
 
+    def add_enemy(self, enemy):
+        '''Добавляет врага на уровень и выдает ему стабильный идентификатор.'''
+        enemy.enemy_id = self.next_enemy_id
+        enemy.handles = self.enemy_handles
+        self.enemy_handles[enemy.enemy_id] = enemy
+        self.next_enemy_id += 1
+        self.enemies.add(enemy)
+
+    def record_escape(self, enemy):
+        '''Учитывает врага, дошедшего до конца пути.'''
+        self.escaped_enemies += 1
+        self.escaped_health += enemy.health
+
     def attempt_place_tower(self, mouse_pos, tower_type):
         '''Пытается разместить башню на сетке в указанной позиции.'''
         tower_classes = {'basic': BasicTower, 'sniper': SniperTower, 'money': MoneyTower}
-        if tower_type in tower_classes and self.game.settings.starting_money >= self.game.settings.tower_cost:
+        if tower_type in tower_classes and self.game.money >= self.game.settings.tower_cost:
             grid_pos = self.game.grid.get_grid_position(mouse_pos)
             if self.game.grid.is_spot_available(grid_pos):
-                self.game.settings.starting_money -= self.game.settings.tower_cost
+                self.game.money -= self.game.settings.tower_cost
                 new_tower = tower_classes[tower_type](grid_pos, self.game)
                 self.towers.add(new_tower)
                 print("Tower placed.")
@@ -70,9 +97,14 @@ class Level:
         else:
             print("Not enough money or unknown tower type.")
 
-    def update(self):
-        '''Обновляет состояние уровня, включая врагов, башни и коллизии.'''
-        current_time = pygame.time.get_ticks()
+    def update(self, current_time=None):
+        '''
+        Обновляет состояние уровня, включая врагов, башни и коллизии.
+        :param current_time: Игровое время в миллисекундах. По умолчанию берётся pygame.time.get_ticks(),
+            headless-прогоны передают собственное время, чтобы не ждать реальных задержек.
+        '''
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
 
         if self.current_wave < len(self.waves) and self.spawned_enemies < len(self.waves[self.current_wave]):
 
@@ -80,12 +112,11 @@ class Level:
                 enemy_info = self.waves[self.current_wave][self.spawned_enemies].copy()
                 enemy_info['game'] = self.game
                 new_enemy = Enemy(**enemy_info)
-                self.enemies.add(new_enemy)
+                self.add_enemy(new_enemy)
                 self.spawned_enemies += 1
                 self.last_spawn_time = current_time
                 # Воспроизведение звука появления врагов
-                pygame.mixer.music.load(self.settings.enemy_spawn)
-                pygame.mixer.music.play(-1)  # Цикл музыки
+                self.game.play_music(self.settings.enemy_spawn)
         collisions = pygame.sprite.groupcollide(self.bullets, self.enemies, True, False)
         for bullet in collisions:
             for enemy in collisions[bullet]:
@@ -96,11 +127,18 @@ class Level:
             tower.update(self.enemies, current_time, self.bullets)
         self.bullets.update()
 
-        if len(self.enemies) == 0 and self.current_wave < len(self.waves) - 1:
+        wave_cleared = len(self.enemies) == 0 and self.spawned_enemies >= len(self.waves[self.current_wave])
+        if wave_cleared and self.current_wave < len(self.waves) - 1:
             self.current_wave += 1
+            self.wave_number += 1
+            self.start_next_wave()
+
+        elif wave_cleared and self.wave_generator is not None:
+            self.wave_number += 1
+            self.waves[self.current_wave] = self.wave_generator.generate(self.wave_number)
             self.start_next_wave()
 
-        elif len(self.enemies) == 0 and self.current_wave == len(self.waves) - 1:
+        elif wave_cleared and self.current_wave == len(self.waves) - 1:
             self.all_waves_complete = True
 
     def draw_path(self, screen):
@@ -119,7 +157,7 @@ class Level:
         for tower in self.towers:
             tower.draw(screen)
             if tower.is_hovered(mouse_pos):
-                tower_stats_text = self.font.render(f"Damage: {tower.damage}, Range: {tower.tower_range}", True,
+                tower_stats_text = self.game.font.render(f"Damage: {tower.damage}, Range: {tower.tower_range}", True,
                                                     (255, 255, 255))
                 screen.blit(tower_stats_text, (tower.rect.x, tower.rect.y - 20))
 
@@ -1,21 +1,26 @@
 
 import pygame
 import sys
+from dataclasses import replace
 
 
-from settings import Settings
-from level import Level
-from grid import Grid
+from settings import SETTINGS
+from simulation import Simulation
+from assets import clear_image_cache
+from audio import load_sound, play_music
 
-class TowerDefenseGame:
+class TowerDefenseGame(Simulation):
     '''
         Главный класс, представляющий игру Tower Defense.
 
     Этот класс управляет инициализацией Pygame, настройками игры, отображением,
     обработкой событий, обновлением игрового состояния и отрисовкой элементов.
+    Игровая логика наследуется от Simulation; при создании инициализируется только дисплей,
+    шрифт и звук инициализируются при первом использовании.
 
     Атрибуты:
         settings (Settings): Настройки игры.
+        money (int): Текущее количество денег игрока.
         screen (Surface): Поверхность, на которую отрисовывается игра.
         clock (Clock): Объект для управления частотой кадров.
         background (Surface): Фоновое изображение игры.
@@ -26,35 +31,49 @@ class TowerDefenseGame:
         selected_tower_type (str): Тип выбранной башни (например, 'basic' или 'sniper').
         is_game_over (bool): Флаг, указывающий на состояние игры - окончена или нет.
     '''
-    def __init__(self):
-        pygame.init()
-        self.settings = Settings()
-        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+    def __init__(self, settings=SETTINGS):
+        pygame.display.init()
+        self.screen = pygame.display.set_mode((settings.screen_width, settings.screen_height))
         pygame.display.set_caption("Tower Defense Game")
+        # Изображения, загруженные до открытия окна, ещё не сконвертированы под формат экрана
+        clear_image_cache()
         self.clock = pygame.time.Clock()
 
-        self.background = pygame.image.load(self.settings.background_image).convert()
+        self.background = pygame.image.load(settings.background_image).convert()
         self.background = pygame.transform.scale(self.background,
-                                                 (self.settings.screen_width, self.settings.screen_height))
+                                                 (settings.screen_width, settings.screen_height))
 
-        self.level = Level(self)
-        self.grid = Grid(self)
+        super().__init__(settings)
 
-        self.font = pygame.font.SysFont("Arial", 24)
-
-        self.shoot_sound = pygame.mixer.Sound(self.settings.shoot_sound)
+        self._font = None
+        self._shoot_sound = None
         self.selected_tower_type = None
         self.is_game_over = False
         self.show_grid = False  # Изначально сетка скрыта
 
+    @property
+    def font(self):
+        '''Шрифт для текста; подсистема шрифтов инициализируется при первом обращении.'''
+        if self._font is None:
+            pygame.font.init()
+            self._font = pygame.font.SysFont("Arial", 24)
+        return self._font
+
+    @property
+    def shoot_sound(self):
+        '''Звук выстрела; звуковая подсистема инициализируется при первом обращении.'''
+        if self._shoot_sound is None:
+            self._shoot_sound = load_sound(self.settings.shoot_sound)
+        return self._shoot_sound
+
+    def play_music(self, path):
+        '''Проигрывает звук через pygame.mixer.music.'''
+        play_music(path)
+
     def game_over(self):
         '''Обрабатывает состояние завершения игры.'''
         self.is_game_over = True
 
-    def is_position_inside(self, pos):
-        """Проверяет, находится ли заданная позиция внутри границ экрана игры."""
-        return 0 <= pos.x <= self.settings.screen_width and 0 <= pos.y <= self.settings.screen_height
-
     def _check_events(self):
         ''' Обрабатывает события, включая нажатия клавиш и клики мыши.'''
         for event in pygame.event.get():
@@ -82,8 +101,7 @@ class TowerDefenseGame:
 
     def _update_game(self):
         '''Обновляет состояние уровня и сетки.'''
-        self.level.update()
-        self.grid.update()
+        self.tick()
 
     def _draw_win_screen(self):
         '''Отрисовывает экран победы.'''
@@ -113,12 +131,15 @@ class TowerDefenseGame:
             if self.show_grid:
                 self.grid.draw(self.screen)
 
-            money_text = self.font.render(f"Money: ${self.settings.starting_money}", True, (255, 255, 255))
+            money_text = self.font.render(f"Money: ${self.money}", True, (255, 255, 255))
             tower_text = self.font.render(
                 f"Selected Tower: {self.selected_tower_type if self.selected_tower_type else 'None'}", True,
                 (255, 255, 255))
-            waves_text = self.font.render(f"Waves Left: {len(self.level.waves) - self.level.current_wave}", True,
-                                          (255, 255, 255))
+            if self.level.wave_generator is not None:
+                waves_text = self.font.render(f"Wave: {self.level.wave_number + 1}", True, (255, 255, 255))
+            else:
+                waves_text = self.font.render(f"Waves Left: {len(self.level.waves) - self.level.current_wave}", True,
+                                              (255, 255, 255))
             enemies_text = self.font.render(f"Enemies Left: {len(self.level.enemies)}", True, (255, 255, 255))
 
             self.screen.blit(money_text, (10, 10))
@@ -137,14 +158,10 @@ class TowerDefenseGame:
 
             self._check_events()
             self._update_game()
-
-            if len(self.level.enemies) == 0 and not self.level.all_waves_complete:
-                self.level.start_next_wave()
-
             self._draw()
             self.clock.tick(60)
 
 
 if __name__ == '__main__':
-    td_game = TowerDefenseGame()
+    td_game = TowerDefenseGame(replace(SETTINGS, endless_mode='--endless' in sys.argv))
     td_game.run_game()
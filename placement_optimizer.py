@@ -0,0 +1,158 @@
+'''
+Автоматический подбор расстановки башен.
+
+Кандидатные клетки ранжируются по таблицам покрытия пути, затем лучевой поиск
+перебирает расстановки и оценивает их ускоренными headless-прогонами уровня.
+Результаты прогонов кэшируются по расстановке, поэтому одинаковые расстановки
+не симулируются повторно.
+
+Пример запуска:
+    python placement_optimizer.py --budgets 300 500 --beam-width 4
+'''
+import argparse
+from dataclasses import replace
+
+import pygame
+
+from level import Level
+from settings import SETTINGS
+from simulation import Simulation
+from tower import BasicTower, SniperTower
+
+FRAME_MS = 1000 / 60
+
+
+class PlacementOptimizer:
+    '''
+    Класс, подбирающий лучшую расстановку башен для пути и бюджета.
+
+    Атрибуты:
+        game (Simulation): Headless-экземпляр игры, на котором прогоняются уровни.
+        tower_classes (dict): Типы башен, участвующие в поиске.
+        tower_ranges (dict): Радиус действия каждого типа башни.
+        beam_width (int): Сколько лучших расстановок сохраняется на каждом шаге поиска.
+        candidate_count (int): Сколько клеток с наибольшим покрытием пути рассматривается.
+        max_ticks (int): Ограничение длительности одного прогона в тиках.
+        coverage_tables (dict): Таблицы покрытия (путь, радиус) -> {клетка: покрытие по сегментам}.
+        results (dict): Кэш прогонов (путь, расстановка) -> оценка.
+        simulations (int): Количество выполненных прогонов.
+        cache_hits (int): Сколько раз оценка расстановки была взята из кэша.
+    '''
+    def __init__(self, game, beam_width=4, candidate_count=12, max_ticks=20000):
+        self.game = game
+        self.tower_classes = {'basic': BasicTower, 'sniper': SniperTower}
+        self.tower_ranges = {name: tower_class((0, 0), game).tower_range
+                             for name, tower_class in self.tower_classes.items()}
+        self.beam_width = beam_width
+        self.candidate_count = candidate_count
+        self.max_ticks = max_ticks
+        self.coverage_tables = {}
+        self.results = {}
+        self.simulations = 0
+        self.cache_hits = 0
+
+    def coverage_table(self, path, tower_range, step=8):
+        '''
+        Возвращает таблицу покрытия: для каждой клетки - длину каждого сегмента пути в радиусе башни.
+        Таблица строится один раз для пары (путь, радиус).
+        '''
+        key = (tuple(path), tower_range)
+        if key not in self.coverage_tables:
+            table = {}
+            for cell in self.game.settings.tower_positions:
+                cell_pos = pygame.math.Vector2(cell)
+                coverage = []
+                for start, end in zip(path, path[1:]):
+                    start, end = pygame.math.Vector2(start), pygame.math.Vector2(end)
+                    samples = max(1, int(start.distance_to(end) // step))
+                    inside = sum(1 for i in range(samples)
+                                 if cell_pos.distance_to(start.lerp(end, (i + 0.5) / samples)) <= tower_range)
+                    coverage.append(inside * start.distance_to(end) / samples)
+                table[cell] = tuple(coverage)
+            self.coverage_tables[key] = table
+        return self.coverage_tables[key]
+
+    def candidates(self, path):
+        '''Возвращает варианты (клетка, тип башни) с наибольшим покрытием пути для каждого типа башни.'''
+        options = []
+        for tower_type, tower_range in self.tower_ranges.items():
+            table = self.coverage_table(path, tower_range)
+            ranked = sorted(table, key=lambda cell: sum(table[cell]), reverse=True)
+            options.extend((cell, tower_type) for cell in ranked[:self.candidate_count] if sum(table[cell]) > 0)
+        return options
+
+    def simulate(self, path, layout):
+        '''
+        Прогоняет уровень с заданной расстановкой без отрисовки на собственном игровом времени.
+        :param path: Путь врагов.
+        :param layout: Отсортированный кортеж пар (клетка, тип башни).
+        :return: Оценка (чем больше, тем лучше): меньше прорвавшихся врагов, затем меньше их здоровья.
+        '''
+        key = (tuple(path), layout)
+        if key in self.results:
+            self.cache_hits += 1
+            return self.results[key]
+
+        if self.game.settings.enemy_path != tuple(path):
+            self.game.settings = replace(self.game.settings, enemy_path=path)
+        level = Level(self.game)
+        self.game.level = level
+        for cell, tower_type in layout:
+            tower = self.tower_classes[tower_type](cell, self.game)
+            tower.last_shot_time = level.last_spawn_time
+            level.towers.add(tower)
+
+        current_time = level.last_spawn_time
+        for _ in range(self.max_ticks):
+            if level.all_waves_complete:
+                break
+            current_time += FRAME_MS
+            level.update(current_time)
+
+        score = (-level.escaped_enemies, -level.escaped_health)
+        self.results[key] = score
+        self.simulations += 1
+        return score
+
+    def optimize(self, path, budget):
+        '''
+        Ищет лучшую расстановку лучевым поиском: на каждом шаге к каждой расстановке из луча
+        добавляется одна башня, и сохраняются beam_width лучших по результатам прогонов.
+        :return: Пара (расстановка, оценка).
+        '''
+        tower_count = budget // self.game.settings.tower_cost
+        options = self.candidates(path)
+        beam = [()]
+        best = ((), self.simulate(path, ()))
+        for _ in range(tower_count):
+            expanded = set()
+            for layout in beam:
+                used_cells = {cell for cell, _ in layout}
+                for cell, tower_type in options:
+                    if cell not in used_cells:
+                        expanded.add(tuple(sorted(layout + ((cell, tower_type),))))
+            if not expanded:
+                break
+            scored = sorted(((self.simulate(path, layout), layout) for layout in expanded), reverse=True)
+            beam = [layout for _, layout in scored[:self.beam_width]]
+            if scored[0][0] > best[1]:
+                best = (scored[0][1], scored[0][0])
+        return best
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Подбор расстановки башен для каждого пути и бюджета.')
+    parser.add_argument('--budgets', type=int, nargs='+', default=[SETTINGS.starting_money],
+                        help='Бюджеты на покупку башен.')
+    parser.add_argument('--beam-width', type=int, default=4, help='Ширина луча поиска.')
+    parser.add_argument('--candidates', type=int, default=12, help='Количество клеток-кандидатов на тип башни.')
+    args = parser.parse_args()
+
+    optimizer = PlacementOptimizer(Simulation(), args.beam_width, args.candidates)
+    for path_index, path in enumerate(optimizer.game.settings.enemy_paths):
+        for budget in args.budgets:
+            layout, (escaped, escaped_health) = optimizer.optimize(path, budget)
+            print(f"Path {path_index + 1}, budget ${budget}: escaped {-escaped} enemies ({-escaped_health} hp)")
+            for cell, tower_type in layout:
+                print(f"    {tower_type} at {cell}")
+    print(f"Simulations run: {optimizer.simulations}, cache hits: {optimizer.cache_hits}")
@@ -1,9 +1,14 @@
 import random
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 
+@dataclass(frozen=True)
 class Settings:
     '''
      Класс, представляющий настройки игры.
+     Настройки неизменяемы: общий экземпляр SETTINGS создаётся один раз при импорте,
+     а изменённые копии получаются через dataclasses.replace().
 
     Атрибуты:
         screen_width (int): Ширина экрана.
@@ -15,8 +20,9 @@ class Settings:
         tower_cost (int): Стоимость размещения башни.
         tower_upgrade_cost (int): Стоимость апгрейда башни.
         tower_sell_percentage (float): Процент возврата от продажи башни.
-        enemy_path (list): Путь, по которому будут двигаться враги.
-        tower_sprites (dict): Словарь, содержащий пути к изображению башен.
+        enemy_paths (tuple): Возможные пути врагов.
+        enemy_path (tuple): Путь, по которому будут двигаться враги (по умолчанию выбирается случайно).
+        tower_sprites (Mapping): Словарь, содержащий пути к изображению башен.
         enemy_sprite (str): Путь к изображению врага.
         bullet_sprite (str): Путь к изображению снаряда.
         background_image (str): Путь к изображению фона игры.
@@ -27,54 +33,75 @@ class Settings:
         background_music (str): Путь к звуковому файлу фоновой музыки.
         starting_money (int): Начальное количество денег игрока.
         lives (int): Количество жизней игрока.
-        tower_positions (list): Список доступных позиций для размещения башен.
+        tower_positions (tuple): Доступные позиции для размещения башен.
+        bullet_speed (float): Скорость полёта пули (пикселей за кадр).
+        homing_bullets (bool): Режим самонаводящихся пуль. Если выключен, башни стреляют с упреждением.
+        endless_mode (bool): Бесконечный режим с процедурно генерируемыми волнами.
+        endless_seed (int): Зерно генератора волн бесконечного режима.
     '''
-    def __init__(self):
-        self.screen_width = 1200
-        self.screen_height = 800
-        self.bg_color = (230, 230, 230)
-        # Сетка
-        self.rows = 10
-        self.cols = 15
-        self.grid_size = (64, 64)
+    screen_width: int = 1200
+    screen_height: int = 800
+    bg_color: tuple = (230, 230, 230)
+    # Сетка
+    rows: int = 10
+    cols: int = 15
+    grid_size: tuple = (64, 64)
 
-        self.tower_cost = 100
-        self.tower_upgrade_cost = 150
-        self.tower_sell_percentage = 0.75
+    tower_cost: int = 100
+    tower_upgrade_cost: int = 150
+    tower_sell_percentage: float = 0.75
 
-        self.enemy_paths = [
-            # Путь 1
-            [(50, 400), (300, 400), (300, 200), (600, 200),
-             (600, 600), (900, 600), (900, 300), (1150, 300)],
+    bullet_speed: float = 5
+    homing_bullets: bool = True
 
-            # Путь 2 (альтернативный)
-            [(50, 600), (200, 600), (200, 400), (500, 400),
-             (500, 700), (800, 700), (800, 500), (1150, 500)],
+    endless_mode: bool = False
+    endless_seed: int = 0
 
-            # Путь 3 (другой вариант)
-            [(50, 300), (250, 300), (250, 500), (550, 500),
-             (550, 250), (850, 250), (850, 400), (1150, 400)]
-        ]
-        # Выбираем случайный путь при запуске
-        self.enemy_path = random.choice(self.enemy_paths)
-        self.tower_sprites = {
-            'basic': 'assets/towers/basic_tower.png',
-            'sniper': 'assets/towers/sniper_tower.png',
-            'money': 'assets/towers/money_tower.png',
-        }
-        self.enemy_sprite = 'assets/enemies/basic_enemy.png'
-        self.bullet_sprite = 'assets/bullets/basic_bullet.png'
-        self.background_image = 'assets/backgrounds/game_background.png'
+    enemy_paths: tuple = (
+        # Путь 1
+        ((50, 400), (300, 400), (300, 200), (600, 200),
+         (600, 600), (900, 600), (900, 300), (1150, 300)),
 
-        self.shoot_sound = 'assets/sounds/shoot.wav'
-        self.upgrade_sound = 'assets/sounds/upgrade.wav'
-        self.sell_sound = 'assets/sounds/sell.wav'
-        self.enemy_hit_sound = 'assets/sounds/enemy_hit.wav'
-        self.background_music = 'assets/sounds/background_music.mp3'
-        self.enemy_spawn = 'assets/sounds/enemy_spawn.wav'
+        # Путь 2 (альтернативный)
+        ((50, 600), (200, 600), (200, 400), (500, 400),
+         (500, 700), (800, 700), (800, 500), (1150, 500)),
 
-        self.starting_money = 500
-        self.lives = 20
+        # Путь 3 (другой вариант)
+        ((50, 300), (250, 300), (250, 500), (550, 500),
+         (550, 250), (850, 250), (850, 400), (1150, 400)),
+    )
+    # Если путь не задан, он выбирается случайно при создании настроек
+    enemy_path: tuple = None
+    tower_sprites: MappingProxyType = field(default_factory=lambda: MappingProxyType({
+        'basic': 'assets/towers/basic_tower.png',
+        'sniper': 'assets/towers/sniper_tower.png',
+        'money': 'assets/towers/money_tower.png',
+    }))
+    enemy_sprite: str = 'assets/enemies/basic_enemy.png'
+    bullet_sprite: str = 'assets/bullets/basic_bullet.png'
+    background_image: str = 'assets/backgrounds/game_background.png'
 
-        self.tower_positions = [(x * self.grid_size[0] + self.grid_size[0] // 2, y * self.grid_size[1] + self.grid_size[1] // 2)
-                                for x in range(1, self.cols) for y in range(3, self.rows)]
+    shoot_sound: str = 'assets/sounds/shoot.wav'
+    upgrade_sound: str = 'assets/sounds/upgrade.wav'
+    sell_sound: str = 'assets/sounds/sell.wav'
+    enemy_hit_sound: str = 'assets/sounds/enemy_hit.wav'
+    background_music: str = 'assets/sounds/background_music.mp3'
+    enemy_spawn: str = 'assets/sounds/enemy_spawn.wav'
+
+    starting_money: int = 500
+    lives: int = 20
+
+    tower_positions: tuple = field(init=False)
+
+    def __post_init__(self):
+        # Поля frozen-датакласса можно заполнить только через object.__setattr__
+        if self.enemy_path is None:
+            object.__setattr__(self, 'enemy_path', random.choice(self.enemy_paths))
+        object.__setattr__(self, 'enemy_path', tuple(self.enemy_path))
+        object.__setattr__(self, 'tower_positions', tuple(
+            (x * self.grid_size[0] + self.grid_size[0] // 2, y * self.grid_size[1] + self.grid_size[1] // 2)
+            for x in range(1, self.cols) for y in range(3, self.rows)))
+
+
+# Общие настройки игры, создаются один раз при первом импорте модуля
+SETTINGS = Settings()
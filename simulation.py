@@ -0,0 +1,40 @@
+from settings import SETTINGS
+from level import Level
+from grid import Grid
+
+
+class Simulation:
+    '''
+    Игровая логика без окна, звука и шрифтов.
+
+    Используется инструментами (балансные скрипты, soak-тест, подбор расстановки башен)
+    и как основа TowerDefenseGame. Импорт и создание не инициализируют подсистемы pygame.
+
+    Атрибуты:
+        settings (Settings): Настройки игры.
+        money (int): Текущее количество денег игрока.
+        level (Level): Объект уровня, содержащий группы башен и врагов.
+        grid (Grid): Объект сетки для размещения башен.
+    '''
+    def __init__(self, settings=SETTINGS):
+        self.settings = settings
+        self.money = self.settings.starting_money
+        self.level = Level(self)
+        self.grid = Grid(self)
+
+    def is_position_inside(self, pos):
+        """Проверяет, находится ли заданная позиция внутри границ экрана игры."""
+        return 0 <= pos.x <= self.settings.screen_width and 0 <= pos.y <= self.settings.screen_height
+
+    def play_music(self, path):
+        '''Проигрывает звук. Без окна и звука ничего не делает, переопределяется в TowerDefenseGame.'''
+        pass
+
+    def tick(self, current_time=None):
+        '''
+        Выполняет один игровой тик.
+        :param current_time: Игровое время в миллисекундах. По умолчанию pygame.time.get_ticks(),
+            которое без инициализированного pygame всегда 0, поэтому headless-прогоны передают время явно.
+        '''
+        self.level.update(current_time)
+        self.grid.update()
@@ -0,0 +1,99 @@
+'''
+Headless soak-тест бесконечного режима.
+
+Прогоняет тысячи процедурных волн без окна и звука на собственном игровом времени
+и периодически выводит RSS процесса и среднее время тика, а в конце - их дрейф.
+
+Пример запуска:
+    python soak_test.py --waves 2000 --seed 1 --report-every 100
+'''
+import argparse
+import gc
+import resource
+import sys
+import time
+from dataclasses import replace
+
+from settings import SETTINGS
+from simulation import Simulation
+
+FRAME_MS = 1000 / 60
+
+
+def current_rss_mb():
+    '''Возвращает текущий RSS процесса в мегабайтах (на не-Linux системах - пиковый RSS).'''
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS возвращает байты, Linux - килобайты
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def place_towers(game, count):
+    '''Расставляет базовые башни на позициях, ближайших к пути врагов.'''
+    game.money += count * game.settings.tower_cost
+    path = game.settings.enemy_path
+
+    def distance_to_path(pos):
+        return min(abs(pos[0] - x) + abs(pos[1] - y) for x, y in path)
+
+    for pos in sorted(game.settings.tower_positions, key=distance_to_path)[:count]:
+        game.level.attempt_place_tower(pos, 'basic')
+
+
+def run(waves, seed, report_every, towers):
+    '''
+    Прогоняет заданное число волн и печатает отчёт.
+    :return: Список замеров (волна, RSS в МБ, среднее время тика в мс, максимум врагов и пуль за интервал).
+    '''
+    game = Simulation(replace(SETTINGS, endless_mode=True, endless_seed=seed))
+    place_towers(game, towers)
+
+    level = game.level
+    sim_time = level.last_spawn_time
+    samples = []
+    ticks = 0
+    tick_seconds = 0.0
+    peak_enemies = peak_bullets = 0
+    last_reported = 0
+    print(f"{'wave':>8} {'rss_mb':>9} {'tick_ms':>9} {'enemies':>8} {'bullets':>8}")
+    while level.wave_number < waves:
+        sim_time += FRAME_MS
+        started = time.perf_counter()
+        level.update(sim_time)
+        tick_seconds += time.perf_counter() - started
+        ticks += 1
+        peak_enemies = max(peak_enemies, len(level.enemies))
+        peak_bullets = max(peak_bullets, len(level.bullets))
+
+        if level.wave_number - last_reported >= report_every:
+            last_reported = level.wave_number
+            gc.collect()
+            sample = (level.wave_number, current_rss_mb(), tick_seconds * 1000 / ticks,
+                      peak_enemies, peak_bullets)
+            samples.append(sample)
+            print(f"{sample[0]:>8} {sample[1]:>9.1f} {sample[2]:>9.3f} {sample[3]:>8} {sample[4]:>8}")
+            ticks = 0
+            tick_seconds = 0.0
+            peak_enemies = peak_bullets = 0
+
+    if len(samples) >= 2:
+        first, last = samples[0], samples[-1]
+        print(f"RSS drift: {last[1] - first[1]:+.1f} MB, tick time drift: {last[2] - first[2]:+.3f} ms "
+              f"(waves {first[0]}-{last[0]}, enemy ids issued: {level.next_enemy_id})")
+    return samples
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Headless soak-тест бесконечного режима.')
+    parser.add_argument('--waves', type=int, default=2000, help='Сколько волн прогнать.')
+    parser.add_argument('--seed', type=int, default=0, help='Зерно генератора волн.')
+    parser.add_argument('--report-every', type=int, default=100, help='Как часто (в волнах) печатать замеры.')
+    parser.add_argument('--towers', type=int, default=6, help='Сколько базовых башен расставить.')
+    args = parser.parse_args()
+    run(args.waves, args.seed, args.report_every, args.towers)
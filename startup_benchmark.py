@@ -0,0 +1,56 @@
+'''
+Замер времени запуска: от начала импорта до завершения первого игрового тика.
+
+Каждый замер выполняется в отдельном процессе, чтобы импорт был холодным.
+Режим simulation - только игровая логика (Simulation), game - полная игра
+с окном (для запуска без экрана используются dummy-драйверы SDL).
+
+Пример запуска:
+    python startup_benchmark.py --runs 5
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MEASURE = {
+    'simulation': (
+        "import time; started = time.perf_counter()\n"
+        "from simulation import Simulation\n"
+        "imported = time.perf_counter()\n"
+        "game = Simulation(); game.tick(0)\n"
+        "print(imported - started, time.perf_counter() - started)\n"
+    ),
+    'game': (
+        "import time; started = time.perf_counter()\n"
+        "from main import TowerDefenseGame\n"
+        "imported = time.perf_counter()\n"
+        "game = TowerDefenseGame(); game._update_game(); game._draw()\n"
+        "print(imported - started, time.perf_counter() - started)\n"
+    ),
+}
+
+
+def measure(mode):
+    '''
+    Запускает замер в новом процессе.
+    :return: Пара (время импорта, время до первого тика) в миллисекундах.
+    '''
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    output = subprocess.run([sys.executable, '-c', MEASURE[mode]], env=env, capture_output=True, text=True,
+                            check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    import_time, first_tick_time = map(float, output.split()[-2:])
+    return import_time * 1000, first_tick_time * 1000
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Замер времени от импорта до первого тика.')
+    parser.add_argument('--runs', type=int, default=5, help='Количество запусков для каждого режима.')
+    parser.add_argument('--mode', choices=list(MEASURE), nargs='+', default=list(MEASURE), help='Режимы замера.')
+    args = parser.parse_args()
+    for mode in args.mode:
+        samples = [measure(mode) for _ in range(args.runs)]
+        import_ms = statistics.median(sample[0] for sample in samples)
+        first_tick_ms = statistics.median(sample[1] for sample in samples)
+        print(f"{mode:>10}: import {import_ms:.1f} ms, import to first tick {first_tick_ms:.1f} ms")
@@ -1,5 +1,6 @@
 import pygame
 from bullet import Bullet
+from assets import load_image
 import math
 import time
 
@@ -67,6 +68,25 @@ class Tower(pygame.sprite.Sprite):
         '''Метод для реализации стрельбы (реализуется в подклассах).'''
         pass
 
+    def create_bullet(self, target):
+        '''
+        Создает пулю, летящую в цель.
+        В режиме самонаведения пуля получает идентификатор врага, иначе стреляет с упреждением.
+        '''
+        if self.game.settings.homing_bullets and target.enemy_id is not None:
+            return Bullet(self.position, target.position, self.damage, self.game, target_id=target.enemy_id)
+        return Bullet(self.position, self.intercept_point(target), self.damage, self.game)
+
+    def intercept_point(self, target):
+        '''Вычисляет точку встречи пули с врагом по его пути и скорости.'''
+        bullet_speed = self.game.settings.bullet_speed
+        aim_point = pygame.math.Vector2(target.position)
+        # Несколько итераций достаточно, чтобы время полёта и позиция врага сошлись
+        for _ in range(3):
+            frames = self.position.distance_to(aim_point) / bullet_speed
+            aim_point = target.predict_position(frames)
+        return aim_point
+
     def rotate_towards_target(self, target):
         '''Поворачивает башню в сторону цели.'''
         dx = target.position.x - self.position.x
@@ -108,7 +128,7 @@ class BasicTower(Tower):
         rate_of_fire (int): Время между выстрелами (1000 мс).'''
     def __init__(self, position, game):
         super().__init__(position, game)
-        self.image = pygame.image.load('assets/towers/basic_tower.png').convert_alpha()
+        self.image = load_image('assets/towers/basic_tower.png')
         self.original_image = self.image
         self.rect = self.image.get_rect(center=self.position)
         self.tower_range = 150
@@ -117,7 +137,7 @@ class BasicTower(Tower):
 
     def shoot(self, target, bullets_group):
         '''Создает пулю и добавляет ее в группу.'''
-        new_bullet = Bullet(self.position, target.position, self.damage, self.game)
+        new_bullet = self.create_bullet(target)
         bullets_group.add(new_bullet)
 
 
@@ -134,7 +154,7 @@ class SniperTower(Tower):
         rate_of_fire (int): Время между выстрелами (2000 мс).'''
     def __init__(self, position, game):
         super().__init__(position, game)
-        self.image = pygame.image.load('assets/towers/sniper_tower.png').convert_alpha()
+        self.image = load_image('assets/towers/sniper_tower.png')
         self.image = pygame.transform.rotate(self.image, 90)
         self.original_image = self.image
         self.rect = self.image.get_rect(center=self.position)
@@ -154,7 +174,7 @@ class SniperTower(Tower):
 
     def shoot(self, target, bullets_group):
         '''Создает пулю и добавляет ее в группу.'''
-        new_bullet = Bullet(self.position, target.position, self.damage, self.game)
+        new_bullet = self.create_bullet(target)
         bullets_group.add(new_bullet)
 
 class MoneyTower(Tower):
@@ -171,7 +191,7 @@ class MoneyTower(Tower):
     '''
     def __init__(self, position, game):
         super().__init__(position, game)
-        self.image = pygame.image.load('assets/towers/money_tower.png').convert_alpha()
+        self.image = load_image('assets/towers/money_tower.png')
         self.original_image = self.image
         self.rect = self.image.get_rect(center=self.position)
 
@@ -182,7 +202,7 @@ class MoneyTower(Tower):
     def update(self, enemies, current_time, bullets_group):
         '''Генерирует деньги, если прошло достаточно времени.'''
         if current_time - self.last_money_time >= self.money_rate:
-            self.game.settings.starting_money += self.money_per_tick
+            self.game.money += self.money_per_tick
             self.last_money_time = current_time
 
     def upgrade(self):
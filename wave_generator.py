@@ -0,0 +1,59 @@
+import math
+import random
+
+
+class WaveGenerator:
+    '''
+    Класс, генерирующий волны врагов для бесконечного режима.
+
+    Волна с номером n всегда получается одинаковой для одного и того же зерна,
+    поэтому хранить уже пройденные волны не нужно.
+
+    Атрибуты:
+        path (list): Путь, по которому движутся враги.
+        seed (int): Зерно генератора случайных чисел.
+        enemy_types (dict): Базовые параметры врагов каждого типа (скорость, здоровье, изображение).
+        health_growth (float): Прирост здоровья врагов за каждую волну.
+        base_count (int): Количество врагов в первой волне.
+    '''
+    def __init__(self, path, seed=0, health_growth=0.15, base_count=5):
+        self.path = path
+        self.seed = seed
+        self.health_growth = health_growth
+        self.base_count = base_count
+        self.enemy_types = {
+            'basic': {'speed': 1, 'health': 100, 'image_path': 'assets/enemies/basic_enemy.png'},
+            'fast': {'speed': 1.5, 'health': 150, 'image_path': 'assets/enemies/fast_enemy.png'},
+            'strong': {'speed': 0.75, 'health': 200, 'image_path': 'assets/enemies/strong_enemy.png'},
+        }
+
+    def difficulty(self, wave_number):
+        '''Возвращает множитель сложности для волны с заданным номером.'''
+        return 1 + self.health_growth * wave_number
+
+    def enemy_count(self, wave_number):
+        '''Возвращает количество врагов в волне: оно растёт без ограничения, но медленнее сложности.'''
+        return self.base_count + int(2 * math.sqrt(wave_number))
+
+    def type_weights(self, wave_number):
+        '''Возвращает веса типов врагов: с ростом номера волны чаще появляются быстрые и сильные враги.'''
+        progress = min(1.0, wave_number / 50)
+        return {'basic': 1.0 - 0.6 * progress, 'fast': 0.2 + 0.4 * progress, 'strong': 0.2 + 0.4 * progress}
+
+    def generate(self, wave_number):
+        '''
+        Генерирует волну врагов.
+        :param wave_number: Номер волны, начиная с 0.
+        :return: Список словарей с параметрами врагов в формате Level.waves.
+        '''
+        rng = random.Random(f"{self.seed}:{wave_number}")
+        difficulty = self.difficulty(wave_number)
+        weights = self.type_weights(wave_number)
+        # Один словарь на тип врага, как и в фиксированных волнах уровня
+        templates = {}
+        for name, enemy_type in self.enemy_types.items():
+            templates[name] = {'path': self.path, 'speed': enemy_type['speed'],
+                               'health': int(enemy_type['health'] * difficulty),
+                               'image_path': enemy_type['image_path']}
+        names = rng.choices(list(weights), weights=list(weights.values()), k=self.enemy_count(wave_number))
+        return [templates[name] for name in names]